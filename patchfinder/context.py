@@ -2,6 +2,7 @@
 
 This module is used to set the context of patch finding by the spider.
 """
+import functools
 import re
 
 
@@ -10,7 +11,7 @@ class Vulnerability:
 
     Attributes:
         vuln_id (str): The vulnerability ID.
-        entrypoint_urls (list[str]): A list of entrypoint URLs for the vulnerability
+        entrypoint_urls (tuple[str]): The entrypoint URLs for the vulnerability
         packages (dict{str: str} or None): Dictionary of packages the vuln affects.
             The keys are the provider to which the package name is relevant.
             Defaults to None.
@@ -20,11 +21,13 @@ class Vulnerability:
             type. Defaults to None.
     """
 
+    __slots__ = ("vuln_id", "entrypoint_urls", "packages")
+
     pattern = None
 
     def __init__(self, vuln_id, entrypoint_urls, packages=None):
         self.vuln_id = vuln_id
-        self.entrypoint_urls = entrypoint_urls
+        self.entrypoint_urls = tuple(entrypoint_urls)
         self.packages = packages
 
     @staticmethod
@@ -52,9 +55,18 @@ class GenericVulnerability(Vulnerability):
             this will point to a JSON-based, XML-based or HTML-based URL to
             facilitate "translation" of the vulnerability to CVEs or equivalent
             vulnerabilities.
+        equivalent_vulns (tuple[Vulnerability]): Vulnerabilities equivalent to
+            this one. Defaults to an empty tuple.
         parse_mode (str): The content type returned by base_url's response.
+        base_url_template (str or None): A format string for the base URL of
+            the vulnerability type, formatted with the vulnerability ID.
+            Defaults to None.
     """
 
+    __slots__ = ("base_url", "equivalent_vulns", "parse_mode")
+
+    base_url_template = None
+
     def __init__(
             self,
             vuln_id,
@@ -64,10 +76,10 @@ class GenericVulnerability(Vulnerability):
             parse_mode=None,
     ):
         self.base_url = base_url
-        self.equivalent_vulns = []
+        self.equivalent_vulns = ()
         self.parse_mode = parse_mode
         if not entrypoint_urls:
-            entrypoint_urls = []
+            entrypoint_urls = ()
         super(GenericVulnerability, self).__init__(
             vuln_id, entrypoint_urls, packages=packages
         )
@@ -76,23 +88,27 @@ class GenericVulnerability(Vulnerability):
 class CVE(Vulnerability):
     """Subclass for CVE (Common Vulnerabilities and Exposures). Inherits from
     the Vulnerability class.
+
+    Attributes:
+        entrypoint_url_templates (tuple[str]): Format strings for the
+            entrypoint URLs of a CVE, formatted with the vulnerability ID.
     """
 
+    __slots__ = ()
+
     pattern = re.compile(r"^CVE[ \-_]\d+[ \-_]\d+$", re.I)
+    entrypoint_url_templates = (
+        "https://nvd.nist.gov/vuln/detail/{0}",
+        "https://cve.mitre.org/cgi-bin/cvename.cgi?name={0}",
+        "https://security-tracker.debian.org/tracker/{0}",
+    )
 
     def __init__(self, vuln_id, packages=None):
         vuln_id = self._normalize_vuln(vuln_id)
-        entrypoint_urls = [
-            "https://nvd.nist.gov/vuln/detail/{vuln_id}".format(
-                vuln_id=vuln_id
-            ),
-            "https://cve.mitre.org/cgi-bin/cvename.cgi?name={vuln_id}".format(
-                vuln_id=vuln_id
-            ),
-            "https://security-tracker.debian.org/tracker/{vuln_id}".format(
-                vuln_id=vuln_id
-            ),
-        ]
+        entrypoint_urls = tuple(
+            template.format(vuln_id)
+            for template in self.entrypoint_url_templates
+        )
         super(CVE, self).__init__(vuln_id, entrypoint_urls, packages=packages)
 
 
@@ -101,13 +117,14 @@ class DSA(GenericVulnerability):
     the GenericVulnerability class.
     """
 
+    __slots__ = ()
+
     pattern = re.compile(r"^DSA[ \-_]\d+([ \-_]\d+)?$", re.I)
+    base_url_template = "https://security-tracker.debian.org/tracker/{0}"
 
     def __init__(self, vuln_id, packages=None):
         vuln_id = self._normalize_vuln(vuln_id)
-        base_url = "https://security-tracker.debian.org/tracker/{vuln_id}".format(
-            vuln_id=vuln_id
-        )
+        base_url = self.base_url_template.format(vuln_id)
         super(DSA, self).__init__(vuln_id, base_url, packages=packages)
 
 
@@ -116,14 +133,16 @@ class RHSA(GenericVulnerability):
     the GenericVulnerability class.
     """
 
+    __slots__ = ()
+
     pattern = re.compile(r"^RHSA[ \-_]\d+:\d+$", re.I)
+    base_url_template = (
+        "https://access.redhat.com/labs/securitydataapi/cve.json?advisory={0}"
+    )
 
     def __init__(self, vuln_id, packages=None):
         vuln_id = self._normalize_vuln(vuln_id)
-        base_url = (
-            "https://access.redhat.com/labs/securitydataapi/"
-            "cve.json?advisory={vuln_id}".format(vuln_id=vuln_id)
-        )
+        base_url = self.base_url_template.format(vuln_id)
         super(RHSA, self).__init__(vuln_id, base_url, packages=packages)
 
 
@@ -132,20 +151,30 @@ class GLSA(GenericVulnerability):
     the GenericVulnerability class.
     """
 
+    __slots__ = ()
+
     pattern = re.compile(r"^GLSA[ \-_]\d+[ \-_]\d+$", re.I)
+    base_url_template = "https://gitweb.gentoo.org/data/glsa.git/plain/{0}.xml"
 
     def __init__(self, vuln_id, packages=None):
         vuln_id = self._normalize_vuln(vuln_id)
-        base_url = (
-            "https://gitweb.gentoo.org/data/glsa.git/plain/"
-            "{vuln_id}.xml".format(vuln_id=vuln_id.lower())
-        )
+        base_url = self.base_url_template.format(vuln_id.lower())
         super(GLSA, self).__init__(vuln_id, base_url, packages=packages)
 
 
+# Vulnerability classes keyed by the first three characters of their
+# notation, which are distinct for each class.
+_VULN_CLASSES = {"CVE": CVE, "DSA": DSA, "RHS": RHSA, "GLS": GLSA}
+
+
 def create_vuln(vuln_id, packages=None):
     """Returns a Vulnerability instance.
 
+    Instances for vulnerabilities without packages are cached by ID, so
+    repeated calls for the same ID return the same instance. These instances
+    are shared, which is why their URLs and equivalent vulnerabilities are
+    stored as tuples.
+
     Args:
         vuln_id (str): The vulnerability ID. It should be recognizable, i.e., there
             should be a corresponding subclass for the vulnerability with its
@@ -156,12 +185,21 @@ def create_vuln(vuln_id, packages=None):
     Returns:
         Vulnerability: An appropriate Vulnerability instance.
     """
+    if packages is None:
+        return _create_cached_vuln(vuln_id)
+    return _create_vuln(vuln_id, packages)
+
+
+@functools.lru_cache(maxsize=4096)
+def _create_cached_vuln(vuln_id):
+    return _create_vuln(vuln_id)
+
+
+def _create_vuln(vuln_id, packages=None):
     vuln = None
-    vuln_classes = [CVE, DSA, RHSA, GLSA]
-    for vuln_class in vuln_classes:
-        if vuln_class.belongs(vuln_id):
-            vuln = vuln_class(vuln_id, packages)
-            break
+    vuln_class = _VULN_CLASSES.get(vuln_id[:3].upper())
+    if vuln_class and vuln_class.belongs(vuln_id):
+        vuln = vuln_class(vuln_id, packages)
     return vuln
 
 
@@ -7,6 +7,7 @@ Attributes:
     logger: Module level logger.
 """
 import argparse
+import concurrent.futures
 import logging
 import os
 import re
@@ -29,8 +30,12 @@ class DebianParser:
         _package_paths (list[dict{str: str}]): A dict of paths to downloaded
             package tarballs.
         _patches (list[dict{str: str}]): A dict of scraped patches.
+        _version_pattern (re.Pattern): Pattern a scraped version must match
+            for its package to be considered fixed.
     """
 
+    _version_pattern = re.compile(r"^\d")
+
     def __init__(self, **kwargs):
         settings = kwargs.get("settings")
         if not settings:
@@ -80,7 +85,7 @@ class DebianParser:
         # Group package names and versions into pairwise tuples
         pkg_vers = list(zip(pkg_vers[::2], pkg_vers[1::2]))
         for pkg_ver in pkg_vers:
-            if not re.match(r"^\d", pkg_ver[1]):
+            if not self._version_pattern.match(pkg_ver[1]):
                 continue
             self._fixed_packages.append(
                 {"package": pkg_ver[0], "version": pkg_ver[1]}
@@ -92,46 +97,65 @@ class DebianParser:
         The Debian packages are downloaded from snapshot.debian.org.
         Since snapshot only has a web interface for access to these packages,
         the corresponding package and version link is extracted and the package
-        is downloaded. This package is a tarball.
+        is downloaded. This package is a tarball. Packages are retrieved
+        concurrently, by at most DOWNLOAD_WORKERS threads.
         """
-
-        for package in self._fixed_packages:
-            pkg = package["package"]
-            ver = package["version"]
-            snapshot_url = "https://snapshot.debian.org/package/{pkg}/{ver}/".format(
-                pkg=pkg, ver=ver
-            )
-            find_pkg = "//a/@href[contains(., '{pkg}_{ver}.debian')]".format(
-                pkg=urllib.parse.quote(pkg), ver=urllib.parse.quote(ver)
-            )
-            pkg_url = utils.parse_web_page(snapshot_url, xpaths=[find_pkg])
-            if not pkg_url:
-                continue
-            pkg_url = urllib.parse.urljoin(
-                "https://snapshot.debian.org/", pkg_url.pop()
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.settings["DOWNLOAD_WORKERS"]
+        ) as executor:
+            package_paths = executor.map(
+                self._retrieve_package, self._fixed_packages
             )
-            pkg_path = os.path.join(
-                self.settings["DOWNLOAD_DIRECTORY"], pkg_url.split("/")[-1]
-            )
-            utils.download_item(pkg_url, pkg_path)
-            self._package_paths.append({"path": pkg_path, "source": pkg_url})
+            self._package_paths.extend(path for path in package_paths if path)
+
+    def _retrieve_package(self, package):
+        """Downloads a fixed package.
+
+        Args:
+            package (dict{str: str}): The fixed package.
+
+        Returns:
+            dict{str: str} or None: The path and source of the downloaded
+                package, or None if the package was not found on snapshot.
+        """
+        pkg = package["package"]
+        ver = package["version"]
+        snapshot_url = "https://snapshot.debian.org/package/{pkg}/{ver}/".format(
+            pkg=pkg, ver=ver
+        )
+        find_pkg = "//a/@href[contains(., '{pkg}_{ver}.debian')]".format(
+            pkg=urllib.parse.quote(pkg), ver=urllib.parse.quote(ver)
+        )
+        pkg_url = utils.parse_web_page(snapshot_url, xpaths=[find_pkg])
+        if not pkg_url:
+            return None
+        pkg_url = urllib.parse.urljoin(
+            "https://snapshot.debian.org/", pkg_url.pop()
+        )
+        pkg_path = os.path.join(
+            self.settings["DOWNLOAD_DIRECTORY"], pkg_url.split("/")[-1]
+        )
+        utils.download_item(pkg_url, pkg_path)
+        return {"path": pkg_path, "source": pkg_url}
 
     def _extract_patches(self):
         """Extract patches from downloaded packages.
 
         Members of the tarballs that are patches and are relevant to the
-        vulnerability are extracted.
+        vulnerability are extracted. Each tarball is scanned sequentially in
+        a single pass, without building an index of its members.
         """
         for package in self._package_paths:
             pkg_path = package["path"]
             pkg_source = package["source"]
             logger.info("Looking for patches in %s", pkg_path)
-            if tarfile.is_tarfile(pkg_path):
-                tar = tarfile.open(pkg_path)
-                for member in tar.getmembers():
+            if not tarfile.is_tarfile(pkg_path):
+                continue
+            with tarfile.open(pkg_path, mode="r|*") as tar:
+                for member in tar:
                     if (
                             member.name.startswith("debian/patches")
-                            and member.name.find(self.vuln_id) is not -1
+                            and self.vuln_id in member.name
                     ):
                         logger.info(
                             "Found patch: %s in %s", member.name, pkg_source
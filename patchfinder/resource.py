@@ -12,6 +12,35 @@ logger = logging.getLogger(__name__)
 
 _PROVIDERS = ["Github", "Gitlab", "Bitbucket", "GitKernel", "Pagure"]
 
+_GITHUB_URL_RE = re.compile(r"^https://github\.com/")
+_MITRE_URL_RE = re.compile(r"^https://cve\.mitre\.org/")
+_NVD_URL_RE = re.compile(r"^https://nvd\.nist\.gov/")
+_DEBIAN_TRACKER_CVE_URL_RE = re.compile(
+    r"^https://security\-tracker\.debian\.org/tracker/CVE\-\d+\-\d+$"
+)
+_DEBIAN_TRACKER_DSA_URL_RE = re.compile(
+    r"^https://security\-tracker\.debian\.org/tracker/DSA\-\d+\-\d+$"
+)
+_OPENWALL_URL_RE = re.compile(
+    r"^https://www.openwall\.com/lists/oss\-security"
+)
+_FEDORA_LISTS_URL_RE = re.compile(
+    r"^https://lists\.fedoraproject\.org/archives/list/"
+)
+_DEBIAN_LISTS_URL_RE = re.compile(r"^https://lists\.debian\.org/")
+_REDHAT_BUGZILLA_URL_RE = re.compile(
+    r"^https://bugzilla\.redhat\.com/show_bug\.cgi\?id="
+)
+_SECLISTS_URL_RE = re.compile(r"^https://seclists\.org/")
+_REDHAT_SECAPI_URL_RE = re.compile(
+    r"^https://access\.redhat\.com/labs/securitydataapi/"
+    r"cve.json\?advisory="
+)
+_GENTOO_GLSA_URL_RE = re.compile(
+    r"^https://gitweb\.gentoo\.org/data/glsa\.git/plain/"
+    r"glsa\-\d+\-\d+\.xml$"
+)
+
 
 # NOTE: is a singleton pattern called for here?
 class Provider:
@@ -25,29 +54,42 @@ class Provider:
     links must be formatted into patch links w/r/t the Provider's patch link
     format.
 
+    The components of subclasses are compiled once at class creation, since
+    a provider is instantiated for every link checked.
+
     Attributes:
-        link_components (list[str]): A list of components in a patch link for
-            this provider.
-        patch_components (list[str]): A list of components in a patch-formatted
+        link_components (list[re.Pattern]): A list of components in a patch
             link for this provider.
-        patch_format_dict (dict[str, str] or None): A dictionary for formatting
-            a link into a patch link. Defaults to {r"/commit/": r"/patch/"}.
+        patch_components (list[re.Pattern]): A list of components in a
+            patch-formatted link for this provider.
+        patch_format_dict (dict[re.Pattern, str] or None): A dictionary for
+            formatting a link into a patch link. Defaults to
+            {re.compile(r"/commit/"): r"/patch/"}.
     """
 
-    patch_format_dict = {r"/commit/": r"/patch/"}
+    link_components = []
+    patch_components = []
+    patch_format_dict = {re.compile(r"/commit/"): r"/patch/"}
 
     def __init__(
-        self, link_components, patch_components, patch_format_dict=None
+        self,
+        link_components=None,
+        patch_components=None,
+        patch_format_dict=None,
     ):
-        self.link_components = link_components
-        self.patch_components = patch_components
+        if link_components:
+            self.link_components = [re.compile(x) for x in link_components]
+        if patch_components:
+            self.patch_components = [re.compile(x) for x in patch_components]
         if patch_format_dict:
-            self.patch_format_dict = patch_format_dict
+            self.patch_format_dict = {
+                re.compile(k): v for k, v in patch_format_dict.items()
+            }
 
     def patch_format(self, link):
         """str: Returns a link formatted into a patch link."""
-        for i in self.patch_format_dict:
-            link = re.sub(i, self.patch_format_dict[i], link)
+        for pattern, repl in self.patch_format_dict.items():
+            link = pattern.sub(repl, link)
         return link
 
     @staticmethod
@@ -56,12 +98,13 @@ class Provider:
 
         Args:
             string (str): String to match patterns with.
-            patterns (list[str]): A list of regular expression patterns.
+            patterns (list[re.Pattern]): A list of compiled regular expression
+                patterns.
 
         Returns:
             bool: True if string matches with all patterns, False otherwise.
         """
-        if all(re.search(x, string) for x in patterns):
+        if all(pattern.search(string) for pattern in patterns):
             return True
         return False
 
@@ -86,69 +129,49 @@ class Provider:
 class Github(Provider):
     """Subclass for GitHub as a Provider."""
 
-    def __init__(self):
-        link_components = [r"github\.com", r"/(commit|pull)/"]
-        patch_components = [r"\.patch$"]
-        patch_format_dict = {r"$": r".patch"}
-        super(Github, self).__init__(
-            link_components=link_components,
-            patch_components=patch_components,
-            patch_format_dict=patch_format_dict,
-        )
+    link_components = [
+        re.compile(r"github\.com"),
+        re.compile(r"/(commit|pull)/"),
+    ]
+    patch_components = [re.compile(r"\.patch$")]
+    patch_format_dict = {re.compile(r"$"): r".patch"}
 
 
 class Pagure(Provider):
     """Subclass for Pagure as a Provider."""
 
-    def __init__(self):
-        link_components = [r"pagure\.io", "/c/"]
-        patch_components = [r"\.patch$"]
-        patch_format_dict = {r"$": r".patch"}
-        super(Pagure, self).__init__(
-            link_components=link_components,
-            patch_components=patch_components,
-            patch_format_dict=patch_format_dict,
-        )
+    link_components = [re.compile(r"pagure\.io"), re.compile(r"/c/")]
+    patch_components = [re.compile(r"\.patch$")]
+    patch_format_dict = {re.compile(r"$"): r".patch"}
 
 
 class Gitlab(Provider):
     """Subclass for Gitlab as a Provider."""
 
-    def __init__(self):
-        link_components = [r"gitlab\.com", r"/commit/"]
-        patch_components = [r"\.patch$"]
-        super(Gitlab, self).__init__(
-            link_components=link_components, patch_components=patch_components
-        )
+    link_components = [re.compile(r"gitlab\.com"), re.compile(r"/commit/")]
+    patch_components = [re.compile(r"\.patch$")]
 
 
 class GitKernel(Provider):
     """Subclass for git.kernel.org as a Provider."""
 
-    def __init__(self):
-        link_components = [
-            r"git\.kernel\.org",
-            r"[0-9a-f]{40}$",
-            r"/(commit|patch)/",
-        ]
-        patch_components = [r"/patch/"]
-        super(GitKernel, self).__init__(
-            link_components=link_components, patch_components=patch_components
-        )
+    link_components = [
+        re.compile(r"git\.kernel\.org"),
+        re.compile(r"[0-9a-f]{40}$"),
+        re.compile(r"/(commit|patch)/"),
+    ]
+    patch_components = [re.compile(r"/patch/")]
 
 
 class Bitbucket(Provider):
     """Subclass for Bitbucket as a Provider."""
 
-    def __init__(self):
-        link_components = [r"bitbucket\.org", "/commits/"]
-        patch_components = [r"/raw$"]
-        patch_format_dict = {r"$": r"/raw"}
-        super(Bitbucket, self).__init__(
-            link_components=link_components,
-            patch_components=patch_components,
-            patch_format_dict=patch_format_dict,
-        )
+    link_components = [
+        re.compile(r"bitbucket\.org"),
+        re.compile(r"/commits/"),
+    ]
+    patch_components = [re.compile(r"/raw$")]
+    patch_format_dict = {re.compile(r"$"): r"/raw"}
 
 
 class Resource:
@@ -160,10 +183,12 @@ class Resource:
         _normal_xpaths (list[str]): A list of xpaths to use for generic scraping
     """
 
-    def __init__(self, url, **kwargs):
+    __slots__ = ("url", "_links_xpaths", "_normal_xpaths")
+
+    def __init__(self, url, links_xpaths=None, normal_xpaths=None):
         self.url = url
-        self._links_xpaths = kwargs.get("links_xpaths")
-        self._normal_xpaths = kwargs.get("normal_xpaths")
+        self._links_xpaths = links_xpaths
+        self._normal_xpaths = normal_xpaths
 
     @staticmethod
     def get_resource(url):
@@ -178,19 +203,19 @@ class Resource:
 
         resource = Resource(url, links_xpaths=["//body//a"])
 
-        if re.match(r"^https://github\.com/", url):
+        if _GITHUB_URL_RE.match(url):
             resource = Resource(
                 url,
                 links_xpaths=["//div[contains(@class, 'commit-message')]//a"],
             )
 
-        elif re.match(r"^https://cve\.mitre\.org/", url):
+        elif _MITRE_URL_RE.match(url):
             resource = Resource(
                 url,
                 links_xpaths=['//*[@id="GeneratedTable"]/table/tr[7]/td//a'],
             )
 
-        elif re.match(r"^https://nvd\.nist\.gov/", url):
+        elif _NVD_URL_RE.match(url):
             resource = Resource(
                 url,
                 links_xpaths=[
@@ -198,10 +223,7 @@ class Resource:
                 ],
             )
 
-        elif re.match(
-            r"^https://security\-tracker\.debian\.org/tracker/CVE\-\d+\-\d+$",
-            url,
-        ):
+        elif _DEBIAN_TRACKER_CVE_URL_RE.match(url):
             resource = Resource(
                 url,
                 links_xpaths=["//pre/a"],
@@ -210,10 +232,7 @@ class Resource:
                 ],
             )
 
-        elif re.match(
-            r"^https://security\-tracker\.debian\.org/tracker/DSA\-\d+\-\d+$",
-            url,
-        ):
+        elif _DEBIAN_TRACKER_DSA_URL_RE.match(url):
             resource = Resource(
                 url,
                 normal_xpaths=[
@@ -221,22 +240,19 @@ class Resource:
                 ],
             )
 
-        elif re.match(r"^https://www.openwall\.com/lists/oss\-security", url):
+        elif _OPENWALL_URL_RE.match(url):
             resource = Resource(url, links_xpaths=["//pre/a"])
 
-        elif re.match(
-            r"^https://lists\.fedoraproject\.org/archives/list/", url
-        ):
+        elif _FEDORA_LISTS_URL_RE.match(url):
             resource = Resource(
-                url, link_xpaths=["//div[contains(@class, 'email-body')]//a"]
+                url,
+                links_xpaths=["//div[contains(@class, 'email-body')]//a"],
             )
 
-        elif re.match(r"^https://lists\.debian\.org/", url):
-            resource = Resource(url, link_xpaths=["//pre/a"])
+        elif _DEBIAN_LISTS_URL_RE.match(url):
+            resource = Resource(url, links_xpaths=["//pre/a"])
 
-        elif re.match(
-            r"^https://bugzilla\.redhat\.com/show_bug\.cgi\?id=", url
-        ):
+        elif _REDHAT_BUGZILLA_URL_RE.match(url):
             resource = Resource(
                 url,
                 links_xpaths=[
@@ -245,21 +261,13 @@ class Resource:
                 ],
             )
 
-        elif re.match(r"^https://seclists\.org/", url):
+        elif _SECLISTS_URL_RE.match(url):
             resource = Resource(url, links_xpaths=["//pre/a"])
 
-        elif re.match(
-            r"^https://access\.redhat\.com/labs/securitydataapi/"
-            r"cve.json\?advisory=",
-            url,
-        ):
+        elif _REDHAT_SECAPI_URL_RE.match(url):
             resource = Resource(url, normal_xpaths=["//cve/text()"])
 
-        elif re.match(
-            r"^https://gitweb\.gentoo\.org/data/glsa\.git/plain/"
-            r"glsa\-\d+\-\d+\.xml$",
-            url,
-        ):
+        elif _GENTOO_GLSA_URL_RE.match(url):
             resource = Resource(url, normal_xpaths=["//references//uri/text()"])
 
         return resource
@@ -10,6 +10,8 @@ Attributes:
     PARSE_DEBIAN (bool): If True, the DebianParser is used while crawling.
     DOWNLOAD_DIRECTORY (str): Path of directory to use for temporary storage of any
         items downloaded.
+    DOWNLOAD_WORKERS (int): The maximum number of items to download
+        concurrently.
     TEMP_FILE (str): Path to a temporary file used by the spider. This file will only
         be used in certain cases to write a response body for further
         processing.
@@ -40,6 +42,7 @@ IMPORTANT_DOMAINS = []
 PATCH_LIMIT = 100
 PARSE_DEBIAN = True
 DOWNLOAD_DIRECTORY = "./cache/"
+DOWNLOAD_WORKERS = 4
 TEMP_FILE = os.path.join(DOWNLOAD_DIRECTORY, "temp_file")
 PATCHES_JSON = "./patches.json"
 ALLOWED_CONTENT_TYPES = [r"text/html", r"text/plain", r"application/json"]
@@ -10,6 +10,10 @@ For meanings of individual settings, refer:
 
 USER_AGENT = "Mozilla/4.0 (compatible; MSIE 7.0; Windows NT 5.1)"
 DEPTH_LIMIT = 1
+# Links are followed across many domains, so allow twice Scrapy's default
+# number of requests in flight overall. The per-domain limit is left at
+# Scrapy's default, so public trackers see no extra load.
+CONCURRENT_REQUESTS = 32
 EXTENSIONS = {
     "scrapy.extensions.telnet.TelnetConsole": None,
     "scrapy.extensions.corestats.CoreStats": None,
@@ -3,11 +3,11 @@
 Attributes:
     logger: Module level logger.
 """
-import json
 import logging
 import re
+from xml.sax.saxutils import escape, quoteattr
 
-import dicttoxml
+import orjson
 import scrapy
 
 from patchfinder.resource import Resource
@@ -15,6 +15,69 @@ from patchfinder.settings import PatchfinderSettings
 
 logger = logging.getLogger(__name__)
 
+_XML_NAME = re.compile(r"^[A-Za-z_][\w.\-]*$")
+
+
+def _to_xml(obj):
+    """Serialize a JSON-decoded object into an XML document.
+
+    Objects map to elements named by their keys, arrays to repeated <item>
+    elements and everything else to text, all under a <root> element, as
+    dicttoxml laid them out. Numeric keys are prefixed with "n", spaces in
+    keys become underscores and keys that are still not valid element names
+    are written as <key name="...">.
+
+    Args:
+        obj (dict or list or str or int or float or bool or None): The object.
+
+    Returns:
+        bytes: The XML document.
+    """
+    parts = ['<?xml version="1.0" encoding="UTF-8" ?><root>']
+    _append_xml(obj, parts)
+    parts.append("</root>")
+    return "".join(parts).encode()
+
+
+def _append_xml(obj, parts):
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            tag = _element_name(key)
+            if tag:
+                parts.append("<%s>" % tag)
+                _append_xml(value, parts)
+                parts.append("</%s>" % tag)
+            else:
+                parts.append("<key name=%s>" % quoteattr(str(key)))
+                _append_xml(value, parts)
+                parts.append("</key>")
+    elif isinstance(obj, list):
+        for item in obj:
+            parts.append("<item>")
+            _append_xml(item, parts)
+            parts.append("</item>")
+    elif isinstance(obj, bool):
+        parts.append("true" if obj else "false")
+    elif obj is not None:
+        parts.append(escape(str(obj)))
+
+
+def _element_name(key):
+    """str or None: Returns an element name for a key, as dicttoxml did."""
+    name = str(key)
+    if _XML_NAME.match(name):
+        return name
+    if name.isdigit():
+        return "n" + name
+    try:
+        return "n%s" % float(name)
+    except ValueError:
+        pass
+    name = name.replace(" ", "_")
+    if _XML_NAME.match(name):
+        return name
+    return None
+
 
 class BaseSpider(scrapy.Spider):
     """Base Scrapy Spider.
@@ -25,8 +88,12 @@ class BaseSpider(scrapy.Spider):
         name (str): Name of the spider.
         allowed_content_types (list[str]): A list of content-types, responses
             of which should be parsed.
+        _json_content_type (re.Pattern): Pattern for content-types of
+            responses to be parsed as JSON.
     """
 
+    _json_content_type = re.compile(r"application/json")
+
     def __init__(self, name, settings=None):
         if not settings:
             settings = PatchfinderSettings()
@@ -93,9 +160,7 @@ class BaseSpider(scrapy.Spider):
         Returns:
             scrapy.http.Response: The same response with an XML body.
         """
-        dictionary = json.loads(response.body.decode())
-        xml = dicttoxml.dicttoxml(dictionary)
-        return response.replace(body=xml)
+        return response.replace(body=_to_xml(orjson.loads(response.body)))
 
     def _generate_items_and_requests(self, response):
         """str: Yields scraped items."""
@@ -162,7 +227,7 @@ class BaseSpider(scrapy.Spider):
             callable: A parse callable.
         """
         content_type = response.headers.get("Content-Type").decode()
-        if re.search(r"application/json", content_type):
+        if self._json_content_type.search(content_type):
             callback = self.parse_json
         else:
             callback = self.parse_default
@@ -37,7 +37,6 @@ class DefaultSpider(BaseSpider):
         important_domains (list[str]): A list of domains with higher crawling
             priority.
         patch_limit (int): A threshold for the number of patches to collect.
-        allowed_keys (set[str]): A set of allowed keys for initialization.
         debian (bool): Boolean value to call the Debian parser.
     """
 
@@ -1,12 +1,57 @@
+import functools
 import logging
 import re
 
 from scrapy.exceptions import IgnoreRequest
 from scrapy.http import Request
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_all(patterns):
+    """Compile regular expressions once per distinct tuple of patterns.
+
+    Each pattern is compiled on its own, so inline flags and group numbers
+    keep the meaning they have when the pattern is used alone.
+
+    Args:
+        patterns (tuple[str]): A tuple of regular expression patterns.
+
+    Returns:
+        tuple: The compiled patterns, in the given order.
+    """
+    return tuple(_compile(pattern) for pattern in patterns)
+
+
+def _compile(pattern):
+    """Compile a regular expression.
+
+    The patterns come from settings, so if google-re2 is installed they are
+    compiled with it for matching in linear time. Patterns RE2 does not
+    support, such as backreferences, fall back to the re module.
+
+    Args:
+        pattern (str): A regular expression pattern.
+
+    Returns:
+        (re.Pattern or re2._Regexp): The compiled pattern.
+    """
+    if re2:
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(pattern, options)
+        except re2.error:
+            logger.debug("Pattern %s not supported by RE2", pattern)
+    return re.compile(pattern)
+
+
 class DepthResetMiddleware:
     """A spider middleware to reset the depth of a request.
 
@@ -64,10 +109,8 @@ class ContentTypeFilterDownloaderMiddleware:
     @staticmethod
     def _is_valid_response(allowed_content_types, content_type):
         """bool: Check if content-type is allowed."""
-        return any(
-            re.search(pattern, content_type)
-            for pattern in allowed_content_types
-        )
+        patterns = _compile_all(tuple(allowed_content_types))
+        return any(pattern.search(content_type) for pattern in patterns)
 
     def process_response(self, response, spider, **kwargs):
         """Process response content-type to determine if it should be allowed.
@@ -2,19 +2,47 @@
 
 Attributes:
     logger: Module level logger.
+    REQUEST_TIMEOUT (int): Timeout in seconds for requests made by the
+        utilities.
+
+Heavy third-party modules and tarfile are imported where they are used, so
+that importing this module stays cheap for callers that need only part of it.
 """
 import logging
 import os
-import tarfile
-import urllib.error
-import urllib.request
-
-import lxml.html
+import shutil
+import threading
 
 from .resource import Resource
 
 logger = logging.getLogger(__name__)
 
+REQUEST_TIMEOUT = 30
+
+_BUFFER_SIZE = 1 << 20
+
+# A shared session, so that connections to the few hosts that are crawled
+# repeatedly (security trackers, snapshot.debian.org) are kept alive and
+# reused rather than renegotiated for every page and download. It is created
+# on first use by _get_session.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    """requests.Session: Returns the shared session, creating it if needed."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            _SESSION = requests.Session()
+            _SESSION.mount(
+                "https://", HTTPAdapter(pool_connections=16, pool_maxsize=32)
+            )
+    return _SESSION
+
 
 def parse_web_page(url, xpaths=None, links=False):
     """Parse a response returned by a URL.
@@ -39,10 +67,14 @@ def parse_web_page(url, xpaths=None, links=False):
     Raises:
         Exception: If there is an error in opening the given URL.
     """
+    import lxml.html
+    import requests
+
     logger.info("Opening %s...", url)
     try:
-        html = urllib.request.urlopen(url)
-    except urllib.error.HTTPError:
+        response = _get_session().get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+    except requests.exceptions.HTTPError:
         raise Exception("Error opening {url}".format(url=url))
     logger.info("Crawled %s", url)
 
@@ -52,13 +84,10 @@ def parse_web_page(url, xpaths=None, links=False):
             xpaths = Resource.get_resource(url).normal_xpaths
         else:
             xpaths = Resource.get_resource(url).links_xpaths
-    elements = lxml.html.fromstring(html.read())
-    for element in elements:
-        if element.tag != "body":
-            continue
+    body = lxml.html.document_fromstring(response.content).find("body")
+    if body is not None:
         for xpath in xpaths:
-            search_results.extend(element.xpath(xpath))
-        break
+            search_results.extend(body.xpath(xpath))
     return search_results
 
 
@@ -78,15 +107,23 @@ def download_item(url, save_as, overwrite=False):
         logger.info("%s exists, not overwriting", save_as)
         return
     parent_dir = os.path.split(save_as)[0]
-    if not os.path.isdir(parent_dir):
-        os.makedirs(parent_dir)
-    urllib.request.urlretrieve(url, save_as)
+    # Items may be downloaded concurrently into the same directory.
+    os.makedirs(parent_dir, exist_ok=True)
+    session = _get_session()
+    with session.get(url, stream=True, timeout=REQUEST_TIMEOUT) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with open(save_as, "wb", buffering=_BUFFER_SIZE) as item:
+            shutil.copyfileobj(response.raw, item, _BUFFER_SIZE)
     logger.info("Downloaded %s...", url)
 
 
 def member_in_tarfile(tar_file, member):
     """Determine if member is a member of a tarfile.
 
+    The tarfile is read as a stream and the search stops at the first match,
+    so an index of all its members is never built.
+
     Args:
         tar_file (str): The path to the tarfile.
         member (str): Name of the member to be searched for.
@@ -94,11 +131,11 @@ def member_in_tarfile(tar_file, member):
     Returns:
         bool: True if member is a member of the tarfile, false otherwise.
     """
-    tar = tarfile.open(tar_file)
-    try:
-        if member in tar.getnames():
-            logger.info("%s found in %s", member, tar_file)
-            return True
-    finally:
-        tar.close()
+    import tarfile
+
+    with tarfile.open(tar_file, mode="r|*") as tar:
+        for tarinfo in tar:
+            if tarinfo.name == member:
+                logger.info("%s found in %s", member, tar_file)
+                return True
     return False
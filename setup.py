@@ -34,9 +34,11 @@ setup(
     ],
     python_requires=">=3.5",
     install_requires=[
-        "dicttoxml==1.7.4",
+        "orjson",
         "PyGithub==1.43",
+        "requests",
         "Scrapy",
         "attrs>=17.4",
     ],
+    extras_require={"re2": ["google-re2"]},
 )
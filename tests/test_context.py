@@ -16,6 +16,11 @@ class TestContext(unittest.TestCase):
         vuln = context.create_vuln("foo bar")
         self.assertFalse(vuln)
 
+    def test_create_vuln_for_unknown_vuln_with_known_prefix(self):
+        """Vulnerability instantiation for an unknown vuln with a known prefix"""
+        vuln = context.create_vuln("DSA foo")
+        self.assertFalse(vuln)
+
     def test_create_vuln_for_inconsistent_cve(self):
         """Vulnerability instantiation for an inconsistent CVE notation"""
         vuln = context.create_vuln("cve 2019-4040")
@@ -36,6 +41,53 @@ class TestContext(unittest.TestCase):
         vuln = context.create_vuln("RHSA-2019:0094")
         self.assertTrue(vuln)
 
+    def test_create_vuln_without_packages_is_cached(self):
+        """Vulnerabilities without packages should be reused by ID"""
+        vuln = context.create_vuln("CVE-2018-20406")
+        self.assertIs(vuln, context.create_vuln("CVE-2018-20406"))
+        self.assertIsNot(
+            vuln,
+            context.create_vuln("CVE-2018-20406", {"upstream": ["python"]}),
+        )
+
+    def test_cached_vulns_are_not_mutable(self):
+        """Shared vulnerabilities should not have mutable sequences"""
+        for vuln_id in ("CVE-2018-20406", "DSA-4444-1", "RHSA-2019:0094"):
+            vuln = context.create_vuln(vuln_id)
+            with self.assertRaises(AttributeError):
+                vuln.entrypoint_urls.append("https://foo")
+            if isinstance(vuln, context.GenericVulnerability):
+                with self.assertRaises(AttributeError):
+                    vuln.equivalent_vulns.append(vuln)
+
+    def test_cve_entrypoint_urls(self):
+        """Entrypoint URLs of a CVE should be formatted with its normalized ID"""
+        vuln = context.create_vuln("cve 2019-4040")
+        self.assertEqual(
+            vuln.entrypoint_urls,
+            (
+                "https://nvd.nist.gov/vuln/detail/CVE-2019-4040",
+                "https://cve.mitre.org/cgi-bin/cvename.cgi?name=CVE-2019-4040",
+                "https://security-tracker.debian.org/tracker/CVE-2019-4040",
+            ),
+        )
+
+    def test_generic_vuln_base_urls(self):
+        """Base URLs of generic vulnerabilities should be formatted"""
+        self.assertEqual(
+            context.create_vuln("DSA-4444-1").base_url,
+            "https://security-tracker.debian.org/tracker/DSA-4444-1",
+        )
+        self.assertEqual(
+            context.create_vuln("RHSA-2019:0094").base_url,
+            "https://access.redhat.com/labs/securitydataapi/cve.json"
+            "?advisory=RHSA-2019:0094",
+        )
+        self.assertEqual(
+            context.create_vuln("GLSA-200602-01").base_url,
+            "https://gitweb.gentoo.org/data/glsa.git/plain/glsa-200602-01.xml",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -96,6 +96,51 @@ class TestDebianParser(unittest.TestCase):
         mock_download_item.assert_not_called()
         self.assertFalse(patches)
 
+    @mock.patch("patchfinder.parsers.debian_parser.utils.parse_web_page")
+    @mock.patch("patchfinder.parsers.debian_parser.utils.download_item")
+    def test_retrieve_packages_with_package_not_on_snapshot(
+            self, mock_download_item, mock_parse_page
+    ):
+        """Packages not on snapshot.d.o should be skipped, order kept.
+
+        Tests:
+            patchfinder.parsers.debian_parser.DebianParser._retrieve_packages
+        """
+        snapshot_links = {
+            "https://snapshot.debian.org/package/foo/1.0-1/": [
+                "/pool/main/f/foo/foo_1.0-1.debian.tar.xz"
+            ],
+            "https://snapshot.debian.org/package/bar/2.0-1/": [],
+            "https://snapshot.debian.org/package/baz/3.0-1/": [
+                "/pool/main/b/baz/baz_3.0-1.debian.tar.xz"
+            ],
+        }
+        mock_parse_page.side_effect = lambda url, xpaths: list(
+            snapshot_links[url]
+        )
+        self.parser._fixed_packages = [
+            {"package": "foo", "version": "1.0-1"},
+            {"package": "bar", "version": "2.0-1"},
+            {"package": "baz", "version": "3.0-1"},
+        ]
+        self.parser._retrieve_packages()
+        self.assertEqual(
+            self.parser._package_paths,
+            [
+                {
+                    "path": "./tests/mocks/foo_1.0-1.debian.tar.xz",
+                    "source": "https://snapshot.debian.org/pool/main/f/foo/"
+                    "foo_1.0-1.debian.tar.xz",
+                },
+                {
+                    "path": "./tests/mocks/baz_3.0-1.debian.tar.xz",
+                    "source": "https://snapshot.debian.org/pool/main/b/baz/"
+                    "baz_3.0-1.debian.tar.xz",
+                },
+            ],
+        )
+        self.assertEqual(mock_download_item.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,6 @@
 """Tests for spider and downloader middlewares."""
 import unittest
+import unittest.mock as mock
 
 from scrapy.exceptions import IgnoreRequest
 from scrapy.http import Request
@@ -45,6 +46,84 @@ class TestMiddlewares(unittest.TestCase):
         with self.assertRaises(IgnoreRequest):
             middleware.process_response(response=response, spider=spider)
 
+    def test_content_type_filter_with_multiple_allowed_content_types(self):
+        """A content-type matching any allowed content-type should be allowed.
+
+        Tests:
+            patchfinder.spiders.middlewares.ContentTypeFilterDownloaderMiddleware
+        """
+        spider = default_spider.DefaultSpider()
+        spider.allowed_content_types = [r"text/html", r"application/json"]
+        middleware = middlewares.ContentTypeFilterDownloaderMiddleware()
+        response = fake_response(
+            url="https://foo", content_type=b"application/json"
+        )
+        self.assertEqual(
+            middleware.process_response(response=response, spider=spider),
+            response,
+        )
+
+    def test_content_type_filter_with_inline_flags_in_allowed_content_types(
+            self
+    ):
+        """Inline flags in any allowed content-type should apply to it alone.
+
+        Tests:
+            patchfinder.spiders.middlewares.ContentTypeFilterDownloaderMiddleware
+        """
+        spider = default_spider.DefaultSpider()
+        spider.allowed_content_types = [r"application/json", r"(?i)text/html"]
+        middleware = middlewares.ContentTypeFilterDownloaderMiddleware()
+        response = fake_response(url="https://foo", content_type=b"TEXT/HTML")
+        self.assertEqual(
+            middleware.process_response(response=response, spider=spider),
+            response,
+        )
+
+    def test_content_type_filter_with_backreferences_in_allowed_content_types(
+            self
+    ):
+        """Backreferences in allowed content-types should keep their groups.
+
+        Tests:
+            patchfinder.spiders.middlewares.ContentTypeFilterDownloaderMiddleware
+        """
+        spider = default_spider.DefaultSpider()
+        spider.allowed_content_types = [r"(a)\1", r"(b)\1"]
+        middleware = middlewares.ContentTypeFilterDownloaderMiddleware()
+        response = fake_response(url="https://foo", content_type=b"bb")
+        self.assertEqual(
+            middleware.process_response(response=response, spider=spider),
+            response,
+        )
+
+    @mock.patch("patchfinder.spiders.middlewares.re2")
+    def test_content_type_filter_with_pattern_unsupported_by_re2(
+            self, mock_re2
+    ):
+        """Patterns RE2 rejects should be compiled with the re module.
+
+        Tests:
+            patchfinder.spiders.middlewares.ContentTypeFilterDownloaderMiddleware
+        """
+
+        class MockRE2Error(Exception):
+            pass
+
+        mock_re2.error = MockRE2Error
+        mock_re2.compile.side_effect = MockRE2Error
+        middlewares._compile_all.cache_clear()
+        self.addCleanup(middlewares._compile_all.cache_clear)
+        spider = default_spider.DefaultSpider()
+        spider.allowed_content_types = [r"(b)\1"]
+        middleware = middlewares.ContentTypeFilterDownloaderMiddleware()
+        response = fake_response(url="https://foo", content_type=b"bb")
+        self.assertEqual(
+            middleware.process_response(response=response, spider=spider),
+            response,
+        )
+        mock_re2.compile.assert_called_once_with(r"(b)\1", mock.ANY)
+
     def test_content_type_filter_for_response_with_no_content_type(self):
         """For response with no content-type, middleware should raise exception.
 
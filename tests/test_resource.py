@@ -37,6 +37,14 @@ class TestResource(unittest.TestCase):
         patch_link = resource.is_patch(link)
         self.assertEqual(patch_link, link + "/raw")
 
+    def test_gitlab_is_patch(self):
+        link = (
+            "https://gitlab.com/libtiff/libtiff/commit/"
+            "0c74a9f49b8d7a36b17b54a7428b3526d20f88a8"
+        )
+        patch_link = resource.is_patch(link)
+        self.assertEqual(patch_link, link.replace("/commit/", "/patch/"))
+
     def test_mitre_url_mapping(self):
         url = "https://cve.mitre.org/cgi-bin/cvename.cgi?name=CVE-2016-4796"
         resource = Resource.get_resource(url)
@@ -52,6 +60,9 @@ class TestResource(unittest.TestCase):
             "TWLQKBMHW/"
         )
         resource = Resource.get_resource(url)
+        self.assertEqual(
+            resource.links_xpaths, ["//div[contains(@class, 'email-body')]//a"]
+        )
 
     def test_debian_lists_url_mapping(self):
         url = (
@@ -59,6 +70,7 @@ class TestResource(unittest.TestCase):
             "9.html"
         )
         resource = Resource.get_resource(url)
+        self.assertEqual(resource.links_xpaths, ["//pre/a"])
 
     def test_seclists_url_mapping(self):
         url = "https://seclists.org/oss-sec/2018/q3/179"
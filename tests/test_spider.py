@@ -201,6 +201,25 @@ class TestSpider(unittest.TestCase):
         requests_and_items = set(self.spider.parse(response))
         self.assertEqual(requests_and_items, expected_items)
 
+    def test_json_response_to_xml_with_nested_json(self):
+        """A JSON response should be converted to XML.
+
+        Tests:
+            patchfinder.spiders.base_spider.BaseSpider._json_response_to_xml
+        """
+        response = fake_response(content_type=b"application/json").replace(
+            body=b'{"a b": [1, null, true, false, {"c": "<&>"}], "1d": 2.5,'
+            b' "123": "e"}'
+        )
+        response = self.spider._json_response_to_xml(response)
+        self.assertEqual(
+            response.body,
+            b'<?xml version="1.0" encoding="UTF-8" ?><root>'
+            b"<a_b><item>1</item><item></item><item>true</item>"
+            b"<item>false</item><item><c>&lt;&amp;&gt;</c></item></a_b>"
+            b'<key name="1d">2.5</key><n123>e</n123></root>',
+        )
+
     def test_determine_aliases_with_no_generic_vulns(self):
         """The aliases of a vulnerability should be scraped from the response.
 